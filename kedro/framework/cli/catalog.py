@@ -1,17 +1,29 @@
 """A collection of CLI commands for working with Kedro catalog."""
 from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
 
 import click
 import yaml
 from click import secho
 
+try:
+    # The libyaml C emitter is several times faster than the pure-Python one,
+    # which matters for projects with large catalogs.
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _YamlDumper
+
 from kedro.framework.cli.utils import KedroCliError, env_option, split_string
 from kedro.framework.project import pipelines, settings
-from kedro.framework.session import KedroSession
 from kedro.framework.startup import ProjectMetadata
 
 
 def _create_session(package_name: str, **kwargs):
+    # Deferred, so that `kedro` invocations that never start a session do not
+    # pay for the session (and transitively DataCatalog) import chain.
+    from kedro.framework.session import KedroSession
+
     kwargs.setdefault("save_on_close", False)
     try:
         return KedroSession.create(package_name, **kwargs)
@@ -52,23 +64,27 @@ def list_datasets(metadata: ProjectMetadata, pipeline, env):
     mentioned = "Datasets mentioned in pipeline"
 
     session = _create_session(metadata.package_name, env=env)
-    context = session.load_context()
-    datasets_meta = context.catalog._data_sets  # pylint: disable=protected-access
-    catalog_ds = set(context.catalog.list())
 
     target_pipelines = pipeline or pipelines.keys()
 
-    result = {}
+    pipeline_datasets = {}
     for pipe in target_pipelines:
         pl_obj = pipelines.get(pipe)
-        if pl_obj:
-            pipeline_ds = pl_obj.data_sets()
-        else:
+        if not pl_obj:
             existing_pls = ", ".join(sorted(pipelines.keys()))
             raise KedroCliError(
                 f"`{pipe}` pipeline not found! Existing pipelines: {existing_pls}"
             )
+        pipeline_datasets[pipe] = pl_obj.data_sets()
+
+    # Load the context only once the requested pipelines are known to exist:
+    # this is by far the most expensive step of the command.
+    context = session.load_context()
+    datasets_meta = context.catalog._data_sets  # pylint: disable=protected-access
+    catalog_ds = set(context.catalog.list())
 
+    result = {}
+    for pipe, pipeline_ds in pipeline_datasets.items():
         unused_ds = catalog_ds - pipeline_ds
         default_ds = pipeline_ds - catalog_ds
         used_ds = catalog_ds - unused_ds
@@ -82,21 +98,28 @@ def list_datasets(metadata: ProjectMetadata, pipeline, env):
         data = ((not_mentioned, dict(unused_by_type)), (mentioned, dict(used_by_type)))
         result[title.format(pipe)] = {key: value for key, value in data if value}
 
-    secho(yaml.dump(result))
+    secho(yaml.dump(result, Dumper=_YamlDumper, sort_keys=False))
 
 
 def _map_type_to_datasets(datasets, datasets_meta):
     """Build dictionary with a dataset type as a key and list of
     datasets of the specific type as a value.
     """
-    mapping = defaultdict(list)
-    for dataset in datasets:
-        is_param = dataset.startswith("params:") or dataset == "parameters"
-        if not is_param:
-            ds_type = datasets_meta[dataset].__class__.__name__
-            if dataset not in mapping[ds_type]:
-                mapping[ds_type].append(dataset)
-    return mapping
+    pairs = sorted(
+        (type(datasets_meta[dataset]).__name__, dataset)
+        for dataset in datasets
+        if dataset != "parameters" and not dataset.startswith("params:")
+    )
+    # Sorting first makes the output deterministic and lets a single groupby
+    # pass build each type bucket; a defaultdict is returned so that callers
+    # can keep appending to absent types.
+    return defaultdict(
+        list,
+        {
+            ds_type: [dataset for _, dataset in group]
+            for ds_type, group in groupby(pairs, key=itemgetter(0))
+        },
+    )
 
 
 @catalog.command("create")
@@ -122,7 +145,6 @@ def create_catalog(metadata: ProjectMetadata, pipeline_name, env):
     """
     env = env or "base"
     session = _create_session(metadata.package_name, env=env)
-    context = session.load_context()
 
     pipeline = pipelines.get(pipeline_name)
 
@@ -132,6 +154,9 @@ def create_catalog(metadata: ProjectMetadata, pipeline_name, env):
             f"`{pipeline_name}` pipeline not found! Existing pipelines: {existing_pipelines}"
         )
 
+    # Defer the expensive context load until the pipeline is known to exist.
+    context = session.load_context()
+
     pipe_datasets = {
         ds_name
         for ds_name in pipeline.data_sets()
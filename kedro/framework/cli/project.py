@@ -24,7 +24,6 @@ from kedro.framework.cli.utils import (
     python_call,
     split_string,
 )
-from kedro.framework.session import KedroSession
 from kedro.framework.startup import ProjectMetadata
 from kedro.utils import load_obj
 
@@ -343,6 +342,10 @@ def run(
     params,
 ):
     """Run the pipeline."""
+    # Deferred, so that `kedro` invocations that never start a session do not
+    # pay for the session (and transitively DataCatalog) import chain.
+    from kedro.framework.session import KedroSession
+
     runner = load_obj(runner or "SequentialRunner", "kedro.runner")
 
     tag = _get_values_as_tuple(tag) if tag else tag
@@ -4,6 +4,7 @@ this directory. You don't need to import the fixtures as pytest will
 discover them automatically. More info here:
 https://docs.pytest.org/en/latest/fixture.html
 """
+import os
 import shutil
 import sys
 import tempfile
@@ -31,6 +32,26 @@ REPO_NAME = "dummy_project"
 PACKAGE_NAME = "dummy_package"
 
 
+@fixture(scope="module")
+def cli_runner():
+    """A single ``CliRunner`` reused across a test module: each ``invoke``
+    call is already isolated, so there is no need to pay for a fresh runner
+    per test."""
+    return CliRunner()
+
+
+@fixture
+def path_is_file(mocker):
+    """Patch ``Path.is_file`` to report every path as an existing file."""
+    return mocker.patch.object(Path, "is_file", return_value=True)
+
+
+@fixture
+def path_is_not_file(mocker):
+    """Patch ``Path.is_file`` to report every path as missing."""
+    return mocker.patch.object(Path, "is_file", return_value=False)
+
+
 @fixture
 def entry_points(mocker):
     return mocker.patch("importlib_metadata.entry_points", spec=True)
@@ -93,8 +114,10 @@ def fake_metadata(fake_root_dir):
 
 
 # This is needed just for the tests, those CLI groups are merged in our
-# code when invoking `kedro` but when imported, they still need to be merged
-@fixture(scope="module")
+# code when invoking `kedro` but when imported, they still need to be merged.
+# Session-scoped: the collection is stateless, so the Click command tree only
+# needs to be assembled once for the whole test run.
+@fixture(scope="session")
 def fake_kedro_cli():
     return click.CommandCollection(
         name="Kedro",
@@ -154,6 +177,12 @@ def fake_project_cli(
             del sys.modules[module]
 
 
-@fixture
-def chdir_to_dummy_project(fake_repo_path, monkeypatch):
-    monkeypatch.chdir(str(fake_repo_path))
+@fixture(scope="module")
+def chdir_to_dummy_project(fake_repo_path, fake_project_cli):
+    # Module-scoped so the chdir syscall is not repeated for every test; the
+    # dummy project must already exist, hence the fake_project_cli dependency.
+    # The original working directory is restored on teardown.
+    old_cwd = os.getcwd()
+    os.chdir(str(fake_repo_path))
+    yield
+    os.chdir(old_cwd)
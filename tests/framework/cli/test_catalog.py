@@ -1,24 +1,66 @@
 import shutil
+from string import Template
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
+import click
 import pytest
 import yaml
-from click.testing import CliRunner
 
-from kedro.extras.datasets.pandas import CSVDataSet
+from kedro.framework.cli.catalog import _YamlDumper, list_datasets
+from kedro.framework.cli.utils import KedroCliError
+from kedro.framework.session import KedroSession
 from kedro.io import DataCatalog, MemoryDataSet
 from kedro.pipeline import Pipeline, node
 
+# Shared mock, built once and reset per test: see test_project.py for the
+# same pattern.
+_load_context_mock = MagicMock()
 
-@pytest.fixture
-def fake_load_context(mocker):
-    context = mocker.MagicMock()
-    return mocker.patch(
-        "kedro.framework.session.KedroSession.load_context", return_value=context
+
+def _make_fake_context(catalog_data_sets=None, project_path=None):
+    """Plain attribute graph standing in for ``KedroContext``: a namespace
+    with just the attributes the catalog commands read avoids MagicMock
+    manufacturing a child mock on every attribute access."""
+    data_sets = catalog_data_sets or {}
+    return SimpleNamespace(
+        catalog=SimpleNamespace(_data_sets=data_sets, list=lambda: list(data_sets)),
+        project_path=project_path,
     )
 
 
+@pytest.fixture(scope="module")
+def csv_data_set_class():
+    # Deferred: the pandas-backed dataset is only needed by a handful of
+    # tests and its import chain would otherwise slow down collection of
+    # this module.
+    from kedro.extras.datasets.pandas import CSVDataSet
+
+    return CSVDataSet
+
+
+@pytest.fixture
+def fake_load_context(monkeypatch):
+    # Tests override `return_value` (or its attributes) as needed.
+    _load_context_mock.reset_mock(return_value=True, side_effect=True)
+    _load_context_mock.return_value = _make_fake_context()
+    monkeypatch.setattr(KedroSession, "load_context", _load_context_mock)
+    return _load_context_mock
+
+
 PIPELINE_NAME = "pipeline"
 
+# Expected `catalog list` output fragments shared across tests, built once at
+# module scope rather than inside every test.
+PIPELINE_TITLE = f"DataSets in '{PIPELINE_NAME}' pipeline"
+EXPECTED_EMPTY_LISTING = {
+    PIPELINE_TITLE: {},
+    "DataSets in 'second' pipeline": {},
+}
+NOT_FOUND_TEMPLATE = Template(
+    "Error: `$bad` pipeline not found! Existing pipelines: $existing\n"
+)
+
 
 @pytest.fixture
 def mock_pipelines(mocker):
@@ -30,67 +72,68 @@ def mock_pipelines(mocker):
     "chdir_to_dummy_project", "fake_load_context", "mock_pipelines"
 )
 class TestCatalogListCommand:
-    def test_list_all_pipelines(self, fake_project_cli, fake_metadata, mocker):
+    def test_list_all_pipelines(
+        self, cli_runner, fake_project_cli, fake_metadata, mocker
+    ):
         yaml_dump_mock = mocker.patch("yaml.dump", return_value="Result YAML")
 
-        result = CliRunner().invoke(
+        result = cli_runner.invoke(
             fake_project_cli, ["catalog", "list"], obj=fake_metadata
         )
 
         assert not result.exit_code
-        expected_dict = {
-            "DataSets in 'pipeline' pipeline": {},
-            "DataSets in 'second' pipeline": {},
-        }
-        yaml_dump_mock.assert_called_once_with(expected_dict)
+        yaml_dump_mock.assert_called_once_with(
+            EXPECTED_EMPTY_LISTING, Dumper=_YamlDumper, sort_keys=False
+        )
 
-    def test_list_specific_pipelines(self, fake_project_cli, fake_metadata, mocker):
+    # `test_list_all_pipelines` covers the CLI wiring end to end; the
+    # remaining cases call the command callback directly, skipping Click's
+    # argv parsing and context setup.
+    def test_list_specific_pipelines(self, fake_metadata, mocker):
         yaml_dump_mock = mocker.patch("yaml.dump", return_value="Result YAML")
 
-        result = CliRunner().invoke(
-            fake_project_cli,
-            ["catalog", "list", "--pipeline", PIPELINE_NAME],
-            obj=fake_metadata,
-        )
-
-        assert not result.exit_code
-        expected_dict = {f"DataSets in '{PIPELINE_NAME}' pipeline": {}}
-        yaml_dump_mock.assert_called_once_with(expected_dict)
+        with click.Context(list_datasets, obj=fake_metadata):
+            list_datasets.callback(pipeline=[PIPELINE_NAME], env=None)
 
-    def test_not_found_pipeline(self, fake_project_cli, fake_metadata):
-        result = CliRunner().invoke(
-            fake_project_cli,
-            ["catalog", "list", "--pipeline", "fake"],
-            obj=fake_metadata,
+        yaml_dump_mock.assert_called_once_with(
+            {PIPELINE_TITLE: {}}, Dumper=_YamlDumper, sort_keys=False
         )
 
-        assert result.exit_code
-        expected_output = (
-            "Error: `fake` pipeline not found! Existing pipelines: pipeline, second"
-        )
-        assert expected_output in result.output
+    def test_not_found_pipeline(self, fake_metadata):
+        pattern = "`fake` pipeline not found! Existing pipelines: pipeline, second"
+        with click.Context(list_datasets, obj=fake_metadata):
+            with pytest.raises(KedroCliError, match=pattern):
+                list_datasets.callback(pipeline=["fake"], env=None)
 
     def test_no_param_datasets_in_respose(
-        self, fake_project_cli, fake_metadata, fake_load_context, mocker, mock_pipelines
+        self,
+        cli_runner,
+        fake_project_cli,
+        fake_metadata,
+        fake_load_context,
+        mocker,
+        mock_pipelines,
+        csv_data_set_class,
     ):
         yaml_dump_mock = mocker.patch("yaml.dump", return_value="Result YAML")
-        mocked_context = fake_load_context.return_value
         catalog_data_sets = {
-            "iris_data": CSVDataSet("test.csv"),
+            "iris_data": csv_data_set_class("test.csv"),
             "intermediate": MemoryDataSet(),
             "parameters": MemoryDataSet(),
             "params:data_ratio": MemoryDataSet(),
-            "not_used": CSVDataSet("test2.csv"),
+            "not_used": csv_data_set_class("test2.csv"),
         }
 
-        mocked_context.catalog = DataCatalog(data_sets=catalog_data_sets)
+        # A namespace catalog is enough here; `test_default_dataset` keeps a
+        # real DataCatalog for integration coverage.
+        fake_load_context.return_value = _make_fake_context(catalog_data_sets)
         mocker.patch.object(
             mock_pipelines[PIPELINE_NAME],
             "data_sets",
             return_value=catalog_data_sets.keys() - {"not_used"},
         )
 
-        result = CliRunner().invoke(
+        result = cli_runner.invoke(
             fake_project_cli,
             ["catalog", "list"],
             obj=fake_metadata,
@@ -99,27 +142,31 @@ class TestCatalogListCommand:
         assert not result.exit_code
         # 'parameters' and 'params:data_ratio' should not appear in the response
         expected_dict = {
-            f"DataSets in '{PIPELINE_NAME}' pipeline": {
-                "Datasets mentioned in pipeline": {
-                    "CSVDataSet": ["iris_data"],
-                    "MemoryDataSet": ["intermediate"],
-                },
-                "Datasets not mentioned in pipeline": {"CSVDataSet": ["not_used"]},
-            }
+            "Datasets mentioned in pipeline": {
+                "CSVDataSet": ["iris_data"],
+                "MemoryDataSet": ["intermediate"],
+            },
+            "Datasets not mentioned in pipeline": {"CSVDataSet": ["not_used"]},
         }
-        key = f"DataSets in '{PIPELINE_NAME}' pipeline"
         assert yaml_dump_mock.call_count == 1
-        assert yaml_dump_mock.call_args[0][0][key] == expected_dict[key]
+        assert yaml_dump_mock.call_args[0][0][PIPELINE_TITLE] == expected_dict
 
     def test_default_dataset(
-        self, fake_project_cli, fake_metadata, fake_load_context, mocker, mock_pipelines
+        self,
+        cli_runner,
+        fake_project_cli,
+        fake_metadata,
+        fake_load_context,
+        mocker,
+        mock_pipelines,
+        csv_data_set_class,
     ):
         """Test that datasets that are found in `Pipeline.data_sets()`,
         but not in the catalog, are outputted under the key "DefaultDataset".
         """
         yaml_dump_mock = mocker.patch("yaml.dump", return_value="Result YAML")
         mocked_context = fake_load_context.return_value
-        catalog_data_sets = {"some_dataset": CSVDataSet("test.csv")}
+        catalog_data_sets = {"some_dataset": csv_data_set_class("test.csv")}
         mocked_context.catalog = DataCatalog(data_sets=catalog_data_sets)
         mocker.patch.object(
             mock_pipelines[PIPELINE_NAME],
@@ -127,7 +174,7 @@ class TestCatalogListCommand:
             return_value=catalog_data_sets.keys() | {"intermediate"},
         )
 
-        result = CliRunner().invoke(
+        result = cli_runner.invoke(
             fake_project_cli,
             ["catalog", "list"],
             obj=fake_metadata,
@@ -135,16 +182,13 @@ class TestCatalogListCommand:
 
         assert not result.exit_code
         expected_dict = {
-            f"DataSets in '{PIPELINE_NAME}' pipeline": {
-                "Datasets mentioned in pipeline": {
-                    "CSVDataSet": ["some_dataset"],
-                    "DefaultDataSet": ["intermediate"],
-                }
+            "Datasets mentioned in pipeline": {
+                "CSVDataSet": ["some_dataset"],
+                "DefaultDataSet": ["intermediate"],
             }
         }
-        key = f"DataSets in '{PIPELINE_NAME}' pipeline"
         assert yaml_dump_mock.call_count == 1
-        assert yaml_dump_mock.call_args[0][0][key] == expected_dict[key]
+        assert yaml_dump_mock.call_args[0][0][PIPELINE_TITLE] == expected_dict
 
 
 def identity(data):
@@ -164,15 +208,17 @@ class TestCatalogCreateCommand:
 
         shutil.rmtree(catalog_path, ignore_errors=True)
 
-    def test_pipeline_argument_is_required(self, fake_project_cli):
-        result = CliRunner().invoke(fake_project_cli, ["catalog", "create"])
+    def test_pipeline_argument_is_required(self, cli_runner, fake_project_cli):
+        result = cli_runner.invoke(fake_project_cli, ["catalog", "create"])
         assert result.exit_code
         expected_output = "Error: Missing option '--pipeline' / '-p'."
         assert expected_output in result.output
 
     @pytest.mark.usefixtures("fake_load_context")
-    def test_not_found_pipeline(self, fake_project_cli, fake_metadata, mock_pipelines):
-        result = CliRunner().invoke(
+    def test_not_found_pipeline(
+        self, cli_runner, fake_project_cli, fake_metadata, mock_pipelines
+    ):
+        result = cli_runner.invoke(
             fake_project_cli,
             ["catalog", "create", "--pipeline", "fake"],
             obj=fake_metadata,
@@ -181,14 +227,13 @@ class TestCatalogCreateCommand:
         assert result.exit_code
 
         existing_pipelines = ", ".join(sorted(mock_pipelines.keys()))
-        expected_output = (
-            f"Error: `fake` pipeline not found! Existing "
-            f"pipelines: {existing_pipelines}\n"
+        expected_output = NOT_FOUND_TEMPLATE.substitute(
+            bad="fake", existing=existing_pipelines
         )
         assert expected_output in result.output
 
     def test_catalog_is_created_in_base_by_default(
-        self, fake_project_cli, fake_metadata, fake_repo_path, catalog_path
+        self, cli_runner, fake_project_cli, fake_metadata, fake_repo_path, catalog_path
     ):
         main_catalog_path = fake_repo_path / "conf" / "base" / "catalog.yml"
         main_catalog_config = yaml.safe_load(main_catalog_path.read_text())
@@ -196,7 +241,7 @@ class TestCatalogCreateCommand:
 
         data_catalog_file = catalog_path / f"{self.PIPELINE_NAME}.yml"
 
-        result = CliRunner().invoke(
+        result = cli_runner.invoke(
             fake_project_cli,
             ["catalog", "create", "--pipeline", self.PIPELINE_NAME],
             obj=fake_metadata,
@@ -216,12 +261,12 @@ class TestCatalogCreateCommand:
 
     @pytest.mark.parametrize("catalog_path", ["local"], indirect=True)
     def test_catalog_is_created_in_correct_env(
-        self, fake_project_cli, fake_metadata, catalog_path
+        self, cli_runner, fake_project_cli, fake_metadata, catalog_path
     ):
         data_catalog_file = catalog_path / f"{self.PIPELINE_NAME}.yml"
 
         env = catalog_path.parent.name
-        result = CliRunner().invoke(
+        result = cli_runner.invoke(
             fake_project_cli,
             ["catalog", "create", "--pipeline", self.PIPELINE_NAME, "--env", env],
             obj=fake_metadata,
@@ -232,17 +277,19 @@ class TestCatalogCreateCommand:
 
     def test_no_missing_datasets(
         self,
+        cli_runner,
         fake_project_cli,
         fake_metadata,
         fake_load_context,
         fake_repo_path,
         mock_pipelines,
+        csv_data_set_class,
     ):
         mocked_context = fake_load_context.return_value
 
         catalog_data_sets = {
-            "input_data": CSVDataSet("test.csv"),
-            "output_data": CSVDataSet("test2.csv"),
+            "input_data": csv_data_set_class("test.csv"),
+            "output_data": csv_data_set_class("test2.csv"),
         }
         mocked_context.catalog = DataCatalog(data_sets=catalog_data_sets)
         mocked_context.project_path = fake_repo_path
@@ -254,7 +301,7 @@ class TestCatalogCreateCommand:
             fake_repo_path / "conf" / "base" / "catalog" / f"{self.PIPELINE_NAME}.yml"
         )
 
-        result = CliRunner().invoke(
+        result = cli_runner.invoke(
             fake_project_cli,
             ["catalog", "create", "--pipeline", self.PIPELINE_NAME],
             obj=fake_metadata,
@@ -265,7 +312,7 @@ class TestCatalogCreateCommand:
 
     @pytest.mark.usefixtures("fake_repo_path")
     def test_missing_datasets_appended(
-        self, fake_project_cli, fake_metadata, catalog_path
+        self, cli_runner, fake_project_cli, fake_metadata, catalog_path
     ):
         data_catalog_file = catalog_path / f"{self.PIPELINE_NAME}.yml"
         assert not catalog_path.exists()
@@ -277,7 +324,7 @@ class TestCatalogCreateCommand:
         with data_catalog_file.open(mode="w") as catalog_file:
             yaml.safe_dump(catalog_config, catalog_file, default_flow_style=False)
 
-        result = CliRunner().invoke(
+        result = cli_runner.invoke(
             fake_project_cli,
             ["catalog", "create", "--pipeline", self.PIPELINE_NAME],
             obj=fake_metadata,
@@ -294,12 +341,12 @@ class TestCatalogCreateCommand:
         catalog_config = yaml.safe_load(data_catalog_file.read_text())
         assert catalog_config == expected_catalog_config
 
-    def test_bad_env(self, fake_project_cli, fake_metadata):
+    def test_bad_env(self, cli_runner, fake_project_cli, fake_metadata):
         """Test error when provided conf environment does not exist"""
         env = "no_such_env"
         cmd = ["catalog", "list", "-e", env, "--pipeline", PIPELINE_NAME]
 
-        result = CliRunner().invoke(fake_project_cli, cmd, obj=fake_metadata)
+        result = cli_runner.invoke(fake_project_cli, cmd, obj=fake_metadata)
 
         assert result.exit_code
         assert "Unable to instantiate Kedro session" in result.output
@@ -1,14 +1,20 @@
+import json
 import logging
 from collections import namedtuple
+from functools import lru_cache
 from itertools import cycle
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-import anyconfig
 import click
-from click.testing import CliRunner
+import yaml
 from pytest import fixture, mark, raises
 
+try:
+    from yaml import CSafeDumper as YamlDumper  # uses the libyaml C bindings
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as YamlDumper
+
 # pylint: disable=unused-import
 import kedro.config.default_logger  # noqa
 from kedro import __version__ as version
@@ -25,6 +31,8 @@ from kedro.framework.cli.utils import (
     CommandCollection,
     KedroCliError,
     _clean_pycache,
+    _config_file_callback,
+    _split_params,
     _update_value_nested_dict,
     forward_command,
     get_pkg_version,
@@ -33,6 +41,31 @@ from kedro.framework.session import KedroSession
 from kedro.runner import ParallelRunner, SequentialRunner
 
 
+RUN_CONFIG_PAYLOAD = {
+    "run": {
+        "pipeline": "pipeline1",
+        "tag": ["tag1", "tag2"],
+        "node_names": ["node1", "node2"],
+    }
+}
+
+
+@lru_cache(maxsize=None)
+def _serialise_run_config(suffix, payload_json):
+    """Serialise a run config once per ``(format, payload)`` pair - YAML
+    serialisation is slow enough to dominate the parametrised run tests."""
+    if suffix == ".json":
+        return payload_json
+    return yaml.dump(json.loads(payload_json), Dumper=YamlDumper)
+
+
+def _write_run_config(config_path, payload):
+    config_path = Path(config_path)
+    config_path.write_text(
+        _serialise_run_config(config_path.suffix, json.dumps(payload, sort_keys=True))
+    )
+
+
 @click.group(name="stub_cli")
 def stub_cli():
     """Stub CLI group description."""
@@ -67,11 +100,16 @@ def requirements_file(tmp_path):
     yield reqs_file
 
 
+# Shared mock, built once and reset per test: constructing the MagicMock
+# attribute chain for every test adds up across the run command tests.
+_session_create_mock = MagicMock()
+
+
 @fixture
-def fake_session(mocker):
-    mock_session_create = mocker.patch.object(KedroSession, "create")
-    mocked_session = mock_session_create.return_value.__enter__.return_value
-    return mocked_session
+def fake_session(monkeypatch):
+    _session_create_mock.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(KedroSession, "create", _session_create_mock)
+    return _session_create_mock.return_value.__enter__.return_value
 
 
 class TestDefaultLogging:
@@ -85,30 +123,30 @@ class TestDefaultLogging:
 
 
 class TestCliCommands:
-    def test_cli(self):
+    def test_cli(self, cli_runner):
         """Run `kedro` without arguments."""
-        result = CliRunner().invoke(cli, [])
+        result = cli_runner.invoke(cli, [])
 
         assert result.exit_code == 0
         assert "kedro" in result.output
 
-    def test_print_version(self):
+    def test_print_version(self, cli_runner):
         """Check that `kedro --version` and `kedro -V` outputs contain
         the current package version."""
-        result = CliRunner().invoke(cli, ["--version"])
+        result = cli_runner.invoke(cli, ["--version"])
 
         assert result.exit_code == 0
         assert version in result.output
 
-        result_abr = CliRunner().invoke(cli, ["-V"])
+        result_abr = cli_runner.invoke(cli, ["-V"])
         assert result_abr.exit_code == 0
         assert version in result_abr.output
 
-    def test_info_contains_plugin_versions(self, entry_point):
+    def test_info_contains_plugin_versions(self, cli_runner, entry_point):
         entry_point.dist.version = "1.0.2"
         entry_point.module = "bob.fred"
 
-        result = CliRunner().invoke(cli, ["info"])
+        result = cli_runner.invoke(cli, ["info"])
         assert result.exit_code == 0
         assert (
             "bob: 1.0.2 (entry points:cli_hooks,global,hooks,init,line_magic,project)"
@@ -117,26 +155,26 @@ class TestCliCommands:
 
         entry_point.load.assert_not_called()
 
-    def test_info_no_plugins(self):
-        result = CliRunner().invoke(cli, ["info"])
+    def test_info_no_plugins(self, cli_runner):
+        result = cli_runner.invoke(cli, ["info"])
         assert result.exit_code == 0
         assert "No plugins installed" in result.output
 
-    def test_help(self):
+    def test_help(self, cli_runner):
         """Check that `kedro --help` returns a valid help message."""
-        result = CliRunner().invoke(cli, ["--help"])
+        result = cli_runner.invoke(cli, ["--help"])
 
         assert result.exit_code == 0
         assert "kedro" in result.output
 
-        result = CliRunner().invoke(cli, ["-h"])
+        result = cli_runner.invoke(cli, ["-h"])
         assert result.exit_code == 0
         assert "-h, --help     Show this message and exit." in result.output
 
     @patch("webbrowser.open")
-    def test_docs(self, patched_browser):
+    def test_docs(self, patched_browser, cli_runner):
         """Check that `kedro docs` opens a correct file in the browser."""
-        result = CliRunner().invoke(cli, ["docs"])
+        result = cli_runner.invoke(cli, ["docs"])
 
         assert result.exit_code == 0
         expected = f"https://kedro.readthedocs.io/en/{version}"
@@ -147,31 +185,31 @@ class TestCliCommands:
 
 
 class TestCommandCollection:
-    def test_found(self):
+    def test_found(self, cli_runner):
         """Test calling existing command."""
         cmd_collection = CommandCollection(("Commands", [cli, stub_cli]))
-        result = CliRunner().invoke(cmd_collection, ["stub_command"])
+        result = cli_runner.invoke(cmd_collection, ["stub_command"])
         assert result.exit_code == 0
         assert "group callback" not in result.output
         assert "command callback" in result.output
 
-    def test_found_reverse(self):
+    def test_found_reverse(self, cli_runner):
         """Test calling existing command."""
         cmd_collection = CommandCollection(("Commands", [stub_cli, cli]))
-        result = CliRunner().invoke(cmd_collection, ["stub_command"])
+        result = cli_runner.invoke(cmd_collection, ["stub_command"])
         assert result.exit_code == 0
         assert "group callback" in result.output
         assert "command callback" in result.output
 
-    def test_not_found(self):
+    def test_not_found(self, cli_runner):
         """Test calling nonexistent command."""
         cmd_collection = CommandCollection(("Commands", [cli, stub_cli]))
-        result = CliRunner().invoke(cmd_collection, ["not_found"])
+        result = cli_runner.invoke(cmd_collection, ["not_found"])
         assert result.exit_code == 2
         assert "No such command" in result.output
         assert "Did you mean one of these" not in result.output
 
-    def test_not_found_closest_match(self, mocker):
+    def test_not_found_closest_match(self, cli_runner, mocker):
         """Check that calling a nonexistent command with a close match returns the close match"""
         patched_difflib = mocker.patch(
             "kedro.framework.cli.utils.difflib.get_close_matches",
@@ -179,7 +217,7 @@ class TestCommandCollection:
         )
 
         cmd_collection = CommandCollection(("Commands", [cli, stub_cli]))
-        result = CliRunner().invoke(cmd_collection, ["not_found"])
+        result = cli_runner.invoke(cmd_collection, ["not_found"])
 
         patched_difflib.assert_called_once_with(
             "not_found", mocker.ANY, mocker.ANY, mocker.ANY
@@ -191,7 +229,7 @@ class TestCommandCollection:
         assert "suggestion_1" in result.output
         assert "suggestion_2" in result.output
 
-    def test_not_found_closet_match_singular(self, mocker):
+    def test_not_found_closet_match_singular(self, cli_runner, mocker):
         """Check that calling a nonexistent command with a close match has the proper wording"""
         patched_difflib = mocker.patch(
             "kedro.framework.cli.utils.difflib.get_close_matches",
@@ -199,7 +237,7 @@ class TestCommandCollection:
         )
 
         cmd_collection = CommandCollection(("Commands", [cli, stub_cli]))
-        result = CliRunner().invoke(cmd_collection, ["not_found"])
+        result = cli_runner.invoke(cmd_collection, ["not_found"])
 
         patched_difflib.assert_called_once_with(
             "not_found", mocker.ANY, mocker.ANY, mocker.ANY
@@ -210,46 +248,46 @@ class TestCommandCollection:
         assert "Did you mean this?" in result.output
         assert "suggestion_1" in result.output
 
-    def test_help(self):
+    def test_help(self, cli_runner):
         """Check that help output includes stub_cli group description."""
         cmd_collection = CommandCollection(("Commands", [cli, stub_cli]))
-        result = CliRunner().invoke(cmd_collection, [])
+        result = cli_runner.invoke(cmd_collection, [])
         assert result.exit_code == 0
         assert "Stub CLI group description" in result.output
         assert "Kedro is a CLI" in result.output
 
 
 class TestForwardCommand:
-    def test_regular(self):
+    def test_regular(self, cli_runner):
         """Test forwarded command invocation."""
-        result = CliRunner().invoke(stub_cli, ["forwarded_command", "bob"])
+        result = cli_runner.invoke(stub_cli, ["forwarded_command", "bob"])
         assert result.exit_code == 0, result.output
         assert "bob" in result.output
         assert "fred" in result.output
         assert "--help" not in result.output
         assert "forwarded_command" not in result.output
 
-    def test_unnamed(self):
+    def test_unnamed(self, cli_runner):
         """Test forwarded command invocation."""
-        result = CliRunner().invoke(stub_cli, ["unnamed", "bob"])
+        result = cli_runner.invoke(stub_cli, ["unnamed", "bob"])
         assert result.exit_code == 0, result.output
         assert "bob" in result.output
         assert "fred" in result.output
         assert "--help" not in result.output
         assert "forwarded_command" not in result.output
 
-    def test_help(self):
+    def test_help(self, cli_runner):
         """Test help output for the command with help flags not forwarded."""
-        result = CliRunner().invoke(stub_cli, ["forwarded_command", "bob", "--help"])
+        result = cli_runner.invoke(stub_cli, ["forwarded_command", "bob", "--help"])
         assert result.exit_code == 0, result.output
         assert "bob" not in result.output
         assert "fred" not in result.output
         assert "--help" in result.output
         assert "forwarded_command" in result.output
 
-    def test_forwarded_help(self):
+    def test_forwarded_help(self, cli_runner):
         """Test help output for the command with forwarded help flags."""
-        result = CliRunner().invoke(stub_cli, ["forwarded_help", "bob", "--help"])
+        result = cli_runner.invoke(stub_cli, ["forwarded_help", "bob", "--help"])
         assert result.exit_code == 0, result.output
         assert "bob" in result.output
         assert "fred" in result.output
@@ -291,6 +329,33 @@ class TestCliUtils:
         ]
         assert mocked_rmtree.mock_calls == expected_calls
 
+    @mark.parametrize(
+        "params,expected",
+        [
+            ({}, {}),
+            ({"params": {"foo": "baz"}}, {"foo": "baz"}),
+            ({"params": "foo:baz"}, {"foo": "baz"}),
+            (
+                {"params": {"foo": "123.45", "baz": "678", "bar": 9}},
+                {"foo": "123.45", "baz": "678", "bar": 9},
+            ),
+        ],
+    )
+    def test_split_params_from_config_file(self, tmp_path, mocker, params, expected):
+        """The `params` entry of a run config file travels through
+        ``_config_file_callback`` into the context default map and is then
+        parsed by ``_split_params``. Cover the variants here at unit level;
+        the CLI wiring itself is exercised once by
+        ``TestRunCommand.test_run_with_params_in_config``."""
+        config_path = str(tmp_path / "run_config.json")
+        _write_run_config(config_path, {"run": {**RUN_CONFIG_PAYLOAD["run"], **params}})
+
+        ctx = mocker.MagicMock(default_map=None, info_name="run")
+        _config_file_callback(ctx, None, config_path)
+
+        value = ctx.default_map.get("params", "")
+        assert _split_params(ctx, mocker.MagicMock(), value) == expected
+
     def test_update_value_nested_dict(self):
         """Test `_update_value_nested_dict` utility function."""
 
@@ -411,19 +476,19 @@ class TestKedroCLI:
             cli,
         ]
 
-    def test_kedro_cli_no_project(self, mocker, tmp_path):
+    def test_kedro_cli_no_project(self, cli_runner, mocker, tmp_path):
         mocker.patch("kedro.framework.cli.cli._is_project", return_value=False)
         kedro_cli = KedroCLI(tmp_path)
         assert len(kedro_cli.global_groups) == 2
         assert kedro_cli.global_groups == [cli, create_cli]
 
-        result = CliRunner().invoke(kedro_cli, [])
+        result = cli_runner.invoke(kedro_cli, [])
 
         assert result.exit_code == 0
         assert "Global commands from Kedro" in result.output
         assert "Project specific commands from Kedro" not in result.output
 
-    def test_kedro_cli_with_project(self, mocker, fake_metadata):
+    def test_kedro_cli_with_project(self, cli_runner, mocker, fake_metadata):
         Module = namedtuple("Module", ["cli"])
         mocker.patch(
             "kedro.framework.cli.cli.importlib.import_module",
@@ -448,7 +513,7 @@ class TestKedroCLI:
             cli,
         ]
 
-        result = CliRunner().invoke(kedro_cli, [])
+        result = cli_runner.invoke(kedro_cli, [])
         assert result.exit_code == 0
         assert "Global commands from Kedro" in result.output
         assert "Project specific commands from Kedro" in result.output
@@ -457,33 +522,27 @@ class TestKedroCLI:
 @mark.usefixtures("chdir_to_dummy_project")
 class TestRunCommand:
     @staticmethod
-    @fixture(params=["run_config.yml", "run_config.json"])
-    def fake_run_config(request, fake_root_dir):
-        config_path = str(fake_root_dir / request.param)
-        anyconfig.dump(
-            {
-                "run": {
-                    "pipeline": "pipeline1",
-                    "tag": ["tag1", "tag2"],
-                    "node_names": ["node1", "node2"],
-                }
-            },
-            config_path,
-        )
+    @fixture
+    def fake_run_config(fake_root_dir):
+        """A run config in JSON format. The config loading is format-agnostic
+        (anyconfig dispatches on extension), so the downstream tests only need
+        one format; the YAML branch is covered once by
+        ``test_run_with_config_yaml_format``."""
+        config_path = str(fake_root_dir / "run_config.json")
+        _write_run_config(config_path, RUN_CONFIG_PAYLOAD)
         return config_path
 
     @staticmethod
     @fixture
     def fake_run_config_with_params(fake_run_config, request):
-        config = anyconfig.load(fake_run_config)
-        config["run"].update(request.param)
-        anyconfig.dump(config, fake_run_config)
+        config = {"run": {**RUN_CONFIG_PAYLOAD["run"], **request.param}}
+        _write_run_config(fake_run_config, config)
         return fake_run_config
 
     def test_run_successfully(
-        self, fake_project_cli, fake_metadata, fake_session, mocker
+        self, cli_runner, fake_project_cli, fake_metadata, fake_session, mocker
     ):
-        result = CliRunner().invoke(fake_project_cli, ["run"], obj=fake_metadata)
+        result = cli_runner.invoke(fake_project_cli, ["run"], obj=fake_metadata)
         assert not result.exit_code
 
         fake_session.run.assert_called_once_with(
@@ -503,12 +562,12 @@ class TestRunCommand:
         assert not runner._is_async
 
     def test_run_with_pipeline_filters(
-        self, fake_project_cli, fake_metadata, fake_session, mocker
+        self, cli_runner, fake_project_cli, fake_metadata, fake_session, mocker
     ):
         from_nodes = ["--from-nodes", "splitting_data"]
         to_nodes = ["--to-nodes", "training_model"]
         tags = ["--tag", "de"]
-        result = CliRunner().invoke(
+        result = cli_runner.invoke(
             fake_project_cli, ["run", *from_nodes, *to_nodes, *tags], obj=fake_metadata
         )
         assert not result.exit_code
@@ -530,9 +589,9 @@ class TestRunCommand:
         assert not runner._is_async
 
     def test_run_successfully_parallel(
-        self, fake_project_cli, fake_metadata, fake_session, mocker
+        self, cli_runner, fake_project_cli, fake_metadata, fake_session, mocker
     ):
-        result = CliRunner().invoke(
+        result = cli_runner.invoke(
             fake_project_cli, ["run", "--runner=ParallelRunner"], obj=fake_metadata
         )
         assert not result.exit_code
@@ -552,8 +611,8 @@ class TestRunCommand:
         assert isinstance(runner, ParallelRunner)
         assert not runner._is_async
 
-    def test_run_async(self, fake_project_cli, fake_metadata, fake_session):
-        result = CliRunner().invoke(
+    def test_run_async(self, cli_runner, fake_project_cli, fake_metadata, fake_session):
+        result = cli_runner.invoke(
             fake_project_cli, ["run", "--async"], obj=fake_metadata
         )
         assert not result.exit_code
@@ -564,6 +623,7 @@ class TestRunCommand:
     @mark.parametrize("config_flag", ["--config", "-c"])
     def test_run_with_config(
         self,
+        cli_runner,
         config_flag,
         fake_project_cli,
         fake_metadata,
@@ -571,7 +631,7 @@ class TestRunCommand:
         fake_run_config,
         mocker,
     ):
-        result = CliRunner().invoke(
+        result = cli_runner.invoke(
             fake_project_cli, ["run", config_flag, fake_run_config], obj=fake_metadata
         )
         assert not result.exit_code
@@ -587,21 +647,44 @@ class TestRunCommand:
             pipeline_name="pipeline1",
         )
 
+    def test_run_with_config_yaml_format(
+        self,
+        cli_runner,
+        fake_project_cli,
+        fake_metadata,
+        fake_session,
+        fake_root_dir,
+        mocker,
+    ):
+        config_path = str(fake_root_dir / "run_config.yml")
+        _write_run_config(config_path, RUN_CONFIG_PAYLOAD)
+
+        result = cli_runner.invoke(
+            fake_project_cli, ["run", "-c", config_path], obj=fake_metadata
+        )
+        assert not result.exit_code
+        fake_session.run.assert_called_once_with(
+            tags=("tag1", "tag2"),
+            runner=mocker.ANY,
+            node_names=("node1", "node2"),
+            from_nodes=[],
+            to_nodes=[],
+            from_inputs=[],
+            to_outputs=[],
+            load_versions={},
+            pipeline_name="pipeline1",
+        )
+
     @mark.parametrize(
         "fake_run_config_with_params,expected",
-        [
-            ({}, {}),
-            ({"params": {"foo": "baz"}}, {"foo": "baz"}),
-            ({"params": "foo:baz"}, {"foo": "baz"}),
-            (
-                {"params": {"foo": "123.45", "baz": "678", "bar": 9}},
-                {"foo": "123.45", "baz": "678", "bar": 9},
-            ),
-        ],
+        # One canonical case: the params-parsing variants are covered at unit
+        # level by ``TestCliUtils.test_split_params_from_config_file``.
+        [({"params": "foo:baz"}, {"foo": "baz"})],
         indirect=["fake_run_config_with_params"],
     )
     def test_run_with_params_in_config(
         self,
+        cli_runner,
         expected,
         fake_project_cli,
         fake_metadata,
@@ -611,7 +694,7 @@ class TestRunCommand:
         mock_session_create = mocker.patch.object(KedroSession, "create")
         mocked_session = mock_session_create.return_value.__enter__.return_value
 
-        result = CliRunner().invoke(
+        result = cli_runner.invoke(
             fake_project_cli,
             ["run", "-c", fake_run_config_with_params],
             obj=fake_metadata,
@@ -665,6 +748,7 @@ class TestRunCommand:
     )
     def test_run_extra_params(
         self,
+        cli_runner,
         mocker,
         fake_project_cli,
         fake_metadata,
@@ -673,7 +757,7 @@ class TestRunCommand:
     ):
         mock_session_create = mocker.patch.object(KedroSession, "create")
 
-        result = CliRunner().invoke(
+        result = cli_runner.invoke(
             fake_project_cli, ["run", "--params", cli_arg], obj=fake_metadata
         )
 
@@ -683,8 +767,10 @@ class TestRunCommand:
         )
 
     @mark.parametrize("bad_arg", ["bad", "foo:bar,bad"])
-    def test_bad_extra_params(self, fake_project_cli, fake_metadata, bad_arg):
-        result = CliRunner().invoke(
+    def test_bad_extra_params(
+        self, cli_runner, fake_project_cli, fake_metadata, bad_arg
+    ):
+        result = cli_runner.invoke(
             fake_project_cli, ["run", "--params", bad_arg], obj=fake_metadata
         )
         assert result.exit_code
@@ -694,8 +780,8 @@ class TestRunCommand:
         )
 
     @mark.parametrize("bad_arg", [":", ":value", " :value"])
-    def test_bad_params_key(self, fake_project_cli, fake_metadata, bad_arg):
-        result = CliRunner().invoke(
+    def test_bad_params_key(self, cli_runner, fake_project_cli, fake_metadata, bad_arg):
+        result = cli_runner.invoke(
             fake_project_cli, ["run", "--params", bad_arg], obj=fake_metadata
         )
         assert result.exit_code
@@ -706,9 +792,16 @@ class TestRunCommand:
         [("--load-version", "dataset1:time1"), ("-lv", "dataset2:time2")],
     )
     def test_reformat_load_versions(
-        self, fake_project_cli, fake_metadata, fake_session, option, value, mocker
+        self,
+        cli_runner,
+        fake_project_cli,
+        fake_metadata,
+        fake_session,
+        option,
+        value,
+        mocker,
     ):
-        result = CliRunner().invoke(
+        result = cli_runner.invoke(
             fake_project_cli, ["run", option, value], obj=fake_metadata
         )
         assert not result.exit_code, result.output
@@ -726,9 +819,11 @@ class TestRunCommand:
             pipeline_name=None,
         )
 
-    def test_fail_reformat_load_versions(self, fake_project_cli, fake_metadata):
+    def test_fail_reformat_load_versions(
+        self, cli_runner, fake_project_cli, fake_metadata
+    ):
         load_version = "2020-05-12T12.00.00"
-        result = CliRunner().invoke(
+        result = cli_runner.invoke(
             fake_project_cli, ["run", "-lv", load_version], obj=fake_metadata
         )
         assert result.exit_code, result.output
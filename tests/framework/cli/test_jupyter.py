@@ -1,7 +1,7 @@
 import json
 import shutil
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from unittest.mock import MagicMock
 
 import pytest
 from click.testing import CliRunner
@@ -15,9 +15,15 @@ from kedro.framework.cli.jupyter import _create_kernel, _export_nodes
 from kedro.framework.cli.utils import KedroCliError
 
 
+# Shared mock, built once and reset per test (see test_project.py).
+_python_call_mock = MagicMock()
+
+
 @pytest.fixture(autouse=True)
-def python_call_mock(mocker):
-    return mocker.patch("kedro.framework.cli.jupyter.python_call")
+def python_call_mock(monkeypatch):
+    _python_call_mock.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr("kedro.framework.cli.jupyter.python_call", _python_call_mock)
+    return _python_call_mock
 
 
 @pytest.fixture
@@ -25,12 +31,31 @@ def create_kernel_mock(mocker):
     return mocker.patch("kedro.framework.cli.jupyter._create_kernel")
 
 
+@pytest.fixture(scope="module")
+def default_jupyter_options(fake_metadata):
+    """The expected kernel identifiers and argv tail, built once per module
+    and shared by the notebook and lab happy-path tests."""
+    kernel_name = f"kedro_{fake_metadata.package_name}"
+    display_name = f"Kedro ({fake_metadata.package_name})"
+    options = [
+        f"--MultiKernelManager.default_kernel_name={kernel_name}",
+        "--random-arg",
+        "value",
+    ]
+    return kernel_name, display_name, options
+
+
 @pytest.mark.usefixtures(
     "chdir_to_dummy_project", "create_kernel_mock", "python_call_mock"
 )
 class TestJupyterNotebookCommand:
     def test_happy_path(
-        self, python_call_mock, fake_project_cli, fake_metadata, create_kernel_mock
+        self,
+        python_call_mock,
+        fake_project_cli,
+        fake_metadata,
+        create_kernel_mock,
+        default_jupyter_options,
     ):
         result = CliRunner().invoke(
             fake_project_cli,
@@ -38,18 +63,9 @@ class TestJupyterNotebookCommand:
             obj=fake_metadata,
         )
         assert not result.exit_code, result.stdout
-        kernel_name = f"kedro_{fake_metadata.package_name}"
-        display_name = f"Kedro ({fake_metadata.package_name})"
+        kernel_name, display_name, options = default_jupyter_options
         create_kernel_mock.assert_called_once_with(kernel_name, display_name)
-        python_call_mock.assert_called_once_with(
-            "jupyter",
-            [
-                "notebook",
-                f"--MultiKernelManager.default_kernel_name={kernel_name}",
-                "--random-arg",
-                "value",
-            ],
-        )
+        python_call_mock.assert_called_once_with("jupyter", ["notebook", *options])
 
     @pytest.mark.parametrize("env_flag,env", [("--env", "base"), ("-e", "local")])
     def test_env(self, env_flag, env, fake_project_cli, fake_metadata, mocker):
@@ -64,7 +80,7 @@ class TestJupyterNotebookCommand:
         assert mock_environ["KEDRO_ENV"] == env
 
     def test_fail_no_jupyter(self, fake_project_cli, mocker):
-        mocker.patch.dict("sys.modules", {"notebook": None})
+        mocker.patch("kedro.framework.cli.utils.import_module", side_effect=ImportError)
         result = CliRunner().invoke(fake_project_cli, ["jupyter", "notebook"])
 
         assert result.exit_code
@@ -80,7 +96,12 @@ class TestJupyterNotebookCommand:
 )
 class TestJupyterLabCommand:
     def test_happy_path(
-        self, python_call_mock, fake_project_cli, fake_metadata, create_kernel_mock
+        self,
+        python_call_mock,
+        fake_project_cli,
+        fake_metadata,
+        create_kernel_mock,
+        default_jupyter_options,
     ):
         result = CliRunner().invoke(
             fake_project_cli,
@@ -88,18 +109,9 @@ class TestJupyterLabCommand:
             obj=fake_metadata,
         )
         assert not result.exit_code, result.stdout
-        kernel_name = f"kedro_{fake_metadata.package_name}"
-        display_name = f"Kedro ({fake_metadata.package_name})"
+        kernel_name, display_name, options = default_jupyter_options
         create_kernel_mock.assert_called_once_with(kernel_name, display_name)
-        python_call_mock.assert_called_once_with(
-            "jupyter",
-            [
-                "lab",
-                f"--MultiKernelManager.default_kernel_name={kernel_name}",
-                "--random-arg",
-                "value",
-            ],
-        )
+        python_call_mock.assert_called_once_with("jupyter", ["lab", *options])
 
     @pytest.mark.parametrize("env_flag,env", [("--env", "base"), ("-e", "local")])
     def test_env(self, env_flag, env, fake_project_cli, fake_metadata, mocker):
@@ -114,7 +126,7 @@ class TestJupyterLabCommand:
         assert mock_environ["KEDRO_ENV"] == env
 
     def test_fail_no_jupyter(self, fake_project_cli, mocker):
-        mocker.patch.dict("sys.modules", {"jupyterlab": None})
+        mocker.patch("kedro.framework.cli.utils.import_module", side_effect=ImportError)
         result = CliRunner().invoke(fake_project_cli, ["jupyter", "lab"])
 
         assert result.exit_code
@@ -170,12 +182,16 @@ class TestConvertNotebookCommand:
     def fake_export_nodes(self, mocker):
         return mocker.patch("kedro.framework.cli.jupyter._export_nodes")
 
-    @pytest.fixture
-    def tmp_file_path(self):
-        with NamedTemporaryFile() as f:
-            yield Path(f.name)
+    @pytest.fixture(scope="session")
+    def tmp_file_path(self, tmp_path_factory):
+        # Only the path is ever used (`_export_nodes` is mocked), but the
+        # file must exist to satisfy Click's `Path(exists=True)` check.
+        path = tmp_path_factory.mktemp("test_jupyter") / "empty.ipynb"
+        path.touch()
+        return path
 
     # pylint: disable=too-many-arguments
+    @pytest.mark.usefixtures("path_is_file")
     def test_convert_one_file_overwrite(
         self,
         mocker,
@@ -189,7 +205,6 @@ class TestConvertNotebookCommand:
         Trying to convert one file, the output file already exists,
         overwriting it.
         """
-        mocker.patch.object(Path, "is_file", return_value=True)
         mocker.patch("click.confirm", return_value=True)
         output_dir = fake_package_path / "nodes"
         assert not output_dir.exists()
@@ -206,6 +221,7 @@ class TestConvertNotebookCommand:
             tmp_file_path.resolve(), output_dir / f"{tmp_file_path.stem}.py"
         )
 
+    @pytest.mark.usefixtures("path_is_file")
     def test_convert_one_file_do_not_overwrite(
         self, mocker, fake_project_cli, fake_export_nodes, tmp_file_path, fake_metadata
     ):
@@ -213,7 +229,6 @@ class TestConvertNotebookCommand:
         Trying to convert one file, the output file already exists,
         user refuses to overwrite it.
         """
-        mocker.patch.object(Path, "is_file", return_value=True)
         mocker.patch("click.confirm", return_value=False)
 
         result = CliRunner().invoke(
@@ -225,6 +240,7 @@ class TestConvertNotebookCommand:
 
         fake_export_nodes.assert_not_called()
 
+    @pytest.mark.usefixtures("path_is_file")
     def test_convert_all_files(
         self,
         mocker,
@@ -234,7 +250,6 @@ class TestConvertNotebookCommand:
         fake_metadata,
     ):
         """Trying to convert all files, the output files already exist."""
-        mocker.patch.object(Path, "is_file", return_value=True)
         mocker.patch("click.confirm", return_value=True)
         mocker.patch(
             "kedro.framework.cli.jupyter.iglob", return_value=["/path/1", "/path/2"]
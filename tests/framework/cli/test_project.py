@@ -2,21 +2,42 @@
 import subprocess
 import sys
 from pathlib import Path
+from unittest.mock import MagicMock, call
 
 import pytest
 from click.testing import CliRunner
 
 from kedro.framework.cli.project import NO_DEPENDENCY_MESSAGE
 
+# Shared mocks, built once and reset per test: constructing a MagicMock and
+# installing a patch for every test adds up across this module.
+_call_mock = MagicMock()
+_python_call_mock = MagicMock()
 
-@pytest.fixture(autouse=True)
-def call_mock(mocker):
-    return mocker.patch("kedro.framework.cli.project.call")
+# Fixture-independent expected call, built once instead of per test.
+SPHINX_BUILD_CALL = call(
+    ["sphinx-build", "-M", "html", "docs/source", "docs/build", "-a"]
+)
 
 
 @pytest.fixture(autouse=True)
-def python_call_mock(mocker):
-    return mocker.patch("kedro.framework.cli.project.python_call")
+def _project_call_mocks(monkeypatch):
+    """Install both subprocess-call patches in one go, so each test resolves
+    a single autouse fixture instead of two."""
+    _call_mock.reset_mock(return_value=True, side_effect=True)
+    _python_call_mock.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr("kedro.framework.cli.project.call", _call_mock)
+    monkeypatch.setattr("kedro.framework.cli.project.python_call", _python_call_mock)
+
+
+@pytest.fixture
+def call_mock():
+    return _call_mock
+
+
+@pytest.fixture
+def python_call_mock():
+    return _python_call_mock
 
 
 @pytest.fixture
@@ -71,7 +92,7 @@ class TestActivateNbstripoutCommand:
         Run activate-nbstripout target without nbstripout installed
         There should be a clear message about it.
         """
-        mocker.patch.dict("sys.modules", {"nbstripout": None})
+        mocker.patch("kedro.framework.cli.utils.import_module", side_effect=ImportError)
 
         result = CliRunner().invoke(
             fake_project_cli, ["activate-nbstripout"], obj=fake_metadata
@@ -115,7 +136,7 @@ class TestTestCommand:
     def test_pytest_not_installed(
         self, fake_project_cli, python_call_mock, mocker, fake_repo_path, fake_metadata
     ):
-        mocker.patch.dict("sys.modules", {"pytest": None})
+        mocker.patch("kedro.framework.cli.utils.import_module", side_effect=ImportError)
 
         result = CliRunner().invoke(
             fake_project_cli, ["test", "--random-arg", "value"], obj=fake_metadata
@@ -131,11 +152,13 @@ class TestTestCommand:
 
 @pytest.mark.usefixtures("chdir_to_dummy_project")
 class TestLintCommand:
+    @pytest.mark.parametrize("check_flags", [(), ("-c",), ("--check-only",)])
     @pytest.mark.parametrize("files", [(), ("src",)])
     def test_lint(
         self,
         fake_project_cli,
         python_call_mock,
+        check_flags,
         files,
         mocker,
         fake_repo_path,
@@ -143,7 +166,7 @@ class TestLintCommand:
     ):
         mocker.patch("kedro.framework.cli.project._check_module_importable")
         result = CliRunner().invoke(
-            fake_project_cli, ["lint", *files], obj=fake_metadata
+            fake_project_cli, ["lint", *check_flags, *files], obj=fake_metadata
         )
         assert not result.exit_code, result.stdout
 
@@ -151,47 +174,11 @@ class TestLintCommand:
             str(fake_repo_path / "src/tests"),
             str(fake_repo_path / "src/dummy_package"),
         )
+        check = ("--check",) if check_flags else ()
         expected_calls = [
-            mocker.call("black", expected_files),
-            mocker.call("flake8", expected_files),
-            mocker.call("isort", expected_files),
-        ]
-
-        assert python_call_mock.call_args_list == expected_calls
-
-    @pytest.mark.parametrize(
-        "check_flag,files",
-        [
-            ("-c", ()),
-            ("--check-only", ()),
-            ("-c", ("src",)),
-            ("--check-only", ("src",)),
-        ],
-    )
-    def test_lint_check_only(
-        self,
-        fake_project_cli,
-        python_call_mock,
-        check_flag,
-        mocker,
-        files,
-        fake_repo_path,
-        fake_metadata,
-    ):
-        mocker.patch("kedro.framework.cli.project._check_module_importable")
-        result = CliRunner().invoke(
-            fake_project_cli, ["lint", check_flag, *files], obj=fake_metadata
-        )
-        assert not result.exit_code, result.stdout
-
-        expected_files = files or (
-            str(fake_repo_path / "src/tests"),
-            str(fake_repo_path / "src/dummy_package"),
-        )
-        expected_calls = [
-            mocker.call("black", ("--check",) + expected_files),
-            mocker.call("flake8", expected_files),
-            mocker.call("isort", ("--check",) + expected_files),
+            call("black", check + expected_files),
+            call("flake8", expected_files),
+            call("isort", check + expected_files),
         ]
 
         assert python_call_mock.call_args_list == expected_calls
@@ -273,7 +260,7 @@ class TestIpythonCommand:
         assert mock_environ["KEDRO_ENV"] == env
 
     def test_fail_no_ipython(self, fake_project_cli, mocker):
-        mocker.patch.dict("sys.modules", {"IPython": None})
+        mocker.patch("kedro.framework.cli.utils.import_module", side_effect=ImportError)
         result = CliRunner().invoke(fake_project_cli, ["ipython"])
 
         assert result.exit_code
@@ -287,13 +274,13 @@ class TestIpythonCommand:
 @pytest.mark.usefixtures("chdir_to_dummy_project")
 class TestPackageCommand:
     def test_happy_path(
-        self, call_mock, fake_project_cli, mocker, fake_repo_path, fake_metadata
+        self, call_mock, fake_project_cli, fake_repo_path, fake_metadata
     ):
         result = CliRunner().invoke(fake_project_cli, ["package"], obj=fake_metadata)
         assert not result.exit_code, result.stdout
         call_mock.assert_has_calls(
             [
-                mocker.call(
+                call(
                     [
                         sys.executable,
                         "setup.py",
@@ -305,7 +292,7 @@ class TestPackageCommand:
                     ],
                     cwd=str(fake_repo_path / "src"),
                 ),
-                mocker.call(
+                call(
                     [
                         sys.executable,
                         "setup.py",
@@ -338,7 +325,7 @@ class TestBuildDocsCommand:
         assert not result.exit_code, result.stdout
         call_mock.assert_has_calls(
             [
-                mocker.call(
+                call(
                     [
                         "sphinx-apidoc",
                         "--module-first",
@@ -347,19 +334,17 @@ class TestBuildDocsCommand:
                         str(fake_repo_path / "src/dummy_package"),
                     ]
                 ),
-                mocker.call(
-                    ["sphinx-build", "-M", "html", "docs/source", "docs/build", "-a"]
-                ),
+                SPHINX_BUILD_CALL,
             ]
         )
         python_call_mock.assert_has_calls(
             [
-                mocker.call("pip", ["install", str(fake_repo_path / "src/[docs]")]),
-                mocker.call(
+                call("pip", ["install", str(fake_repo_path / "src/[docs]")]),
+                call(
                     "pip",
                     ["install", "-r", str(fake_repo_path / "src/requirements.txt")],
                 ),
-                mocker.call("ipykernel", ["install", "--user", "--name=dummy_package"]),
+                call("ipykernel", ["install", "--user", "--name=dummy_package"]),
             ]
         )
         fake_rmtree.assert_called_once_with("docs/build", ignore_errors=True)
@@ -378,18 +363,15 @@ class TestBuildDocsCommand:
 
 @pytest.mark.usefixtures("chdir_to_dummy_project", "fake_copyfile")
 class TestBuildReqsCommand:
+    @pytest.mark.usefixtures("path_is_file")  # the input requirements file exists
     def test_compile_from_requirements_file(
         self,
         python_call_mock,
         fake_project_cli,
-        mocker,
         fake_repo_path,
         fake_copyfile,
         fake_metadata,
     ):
-        # File exists:
-        mocker.patch.object(Path, "is_file", return_value=True)
-
         result = CliRunner().invoke(fake_project_cli, ["build-reqs"], obj=fake_metadata)
         assert not result.exit_code, result.stdout
         assert "Requirements built!" in result.stdout
@@ -464,6 +446,7 @@ class TestBuildReqsCommand:
         )
         python_call_mock.assert_called_once_with("piptools", call_args)
 
+    @pytest.mark.usefixtures("path_is_not_file")
     @pytest.mark.parametrize("os_name", ["posix", "nt"])
     def test_missing_requirements_txt(
         self, fake_project_cli, mocker, fake_metadata, os_name, fake_repo_path
@@ -472,7 +455,6 @@ class TestBuildReqsCommand:
         requirements_txt = fake_repo_path / "src" / "requirements.txt"
 
         mocker.patch("kedro.framework.cli.project.os").name = os_name
-        mocker.patch.object(Path, "is_file", return_value=False)
         result = CliRunner().invoke(fake_project_cli, ["build-reqs"], obj=fake_metadata)
         assert result.exit_code  # Error expected
         assert isinstance(result.exception, FileNotFoundError)